@@ -12,9 +12,25 @@ Features:
 """
 
 import logging
-from typing import Dict, Any
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import exp, expm1, isfinite, log1p
+from typing import Any, Dict, Optional
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json parser is used without it
+    orjson = None
 
 from telegram import Update
+from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -25,44 +41,147 @@ from telegram.ext import (
 )
 
 from config import (
-    TELEGRAM_BOT_TOKEN,
+    get_settings,
+    MAX_LOAN_AMOUNT,
     MIN_LOAN_TERM_YEARS,
     MAX_LOAN_TERM_YEARS,
     MIN_INTEREST_RATE,
     MAX_INTEREST_RATE,
+    SESSION_TIMEOUT_SECONDS,
+    SESSION_EVICTION_INTERVAL_SECONDS,
 )
 
-# Configure logging
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
 logger = logging.getLogger(__name__)
 
 # Conversation states
 LOAN_AMOUNT, DOWN_PAYMENT, LOAN_TERM, INTEREST_RATE = range(4)
 
-# In-memory session storage (per chat_id)
-sessions: Dict[int, Dict[str, Any]] = {}
+
+@dataclass(slots=True)
+class Session:
+    """Answers collected so far in one chat's calculation."""
+
+    loan_amount: Optional[float] = None
+    down_payment: Optional[float] = None
+    loan_term: Optional[int] = None
+    interest_rate: Optional[float] = None
+    last_touch: float = field(default_factory=time.monotonic)
+
+
+# Key of the Session object in each chat's context.chat_data
+SESSION_KEY = "session"
+
+# Reply texts, built once at import time
+_WELCOME_TEXT = (
+    "🏠 <b>Mortgage Calculator 2026 (Russia)</b>\n\n"
+    "I will help you calculate your monthly mortgage payment.\n"
+    "All data is stored only during this session and will be deleted afterwards.\n\n"
+    "<b>Step 1:</b> Enter the loan amount you want (in RUB):"
+)
+
+_HELP_TEXT = (
+    "🏠 <b>Mortgage Calculator Bot</b>\n\n"
+    "This bot helps you calculate monthly mortgage payments.\n\n"
+    "<b>Commands:</b>\n"
+    "/start - Begin new calculation\n"
+    "/cancel - Cancel current calculation\n"
+    "/help - Show this help message\n\n"
+    "<b>How to use:</b>\n"
+    "1. Send /start to begin\n"
+    "2. Enter the loan amount\n"
+    "3. Enter your down payment\n"
+    "4. Enter loan term in years\n"
+    "5. Enter interest rate\n"
+    "6. Get your calculation results!\n\n"
+    "⚠️ All data is deleted after calculation is complete."
+)
+
+_CANCEL_TEXT = (
+    "❌ Calculation cancelled. All data has been deleted.\n\n"
+    "Type /start to begin a new calculation."
+)
+
+_UNKNOWN_TEXT = (
+    "👋 Hello! I'm a Mortgage Calculator Bot.\n\n"
+    "Type /start to begin calculating your mortgage payment,\n"
+    "or /help for more information."
+)
+
+_EXPIRED_TEXT = (
+    "⌛ Your session has expired and its data has been deleted.\n\n"
+    "Type /start to begin a new calculation."
+)
+
+_RESULTS_TEMPLATE = (
+    "📊 <b>CALCULATION RESULTS:</b>\n\n"
+    "• Loan Amount: {loan_amount}\n"
+    "• Down Payment: {down_payment}\n"
+    "• Loan Principal: {principal}\n"
+    "• Loan Term: {loan_term} years ({months} months)\n"
+    "• Interest Rate: {interest_rate:.1f}% per year\n\n"
+    "💸 <b>Monthly Payment:</b> ~{monthly_payment}\n"
+    "💰 <b>Total Payment:</b> ~{total_payment}\n"
+    "💎 <b>Total Interest:</b> ~{total_interest}\n\n"
+    "⚠️ <i>Note: This is an estimate. Actual terms may vary.</i>\n"
+    "<i>All your data has been deleted from memory.</i>\n\n"
+    "Type /start for new calculation."
+)
+
+# Turns "," thousand separators into spaces in a single pass
+_SPACE_TBL = str.maketrans(",", " ")
+
+# Comma becomes the decimal dot, spaces (thousand separators) are dropped
+_PARSE_TBL = str.maketrans({",": ".", " ": None})
 
 
 def format_currency(amount: float) -> str:
     """Format a number as Russian Rubles with thousand separators."""
-    return f"{amount:,.0f}".replace(",", " ") + " RUB"
+    return format(round(amount), ",d").translate(_SPACE_TBL) + " RUB"
 
 
 def parse_number(text: str) -> float | None:
     """
     Parse a number from user input.
     Handles both dot and comma as decimal separators.
-    Returns None if parsing fails.
+    Returns None if parsing fails or the number is not finite.
     """
-    try:
-        # Replace comma with dot for decimal separator
-        cleaned = text.strip().replace(",", ".").replace(" ", "")
-        return float(cleaned)
-    except ValueError:
-        return None
+    cleaned = text.translate(_PARSE_TBL)
+    # Plain integers are the common case and can't fail to parse
+    if cleaned.isdecimal():
+        value = float(cleaned)
+    else:
+        try:
+            value = float(cleaned)
+        except ValueError:
+            return None
+    # Reject "inf", "nan" and overflowing input like "1e400" or "9" * 400
+    return value if isfinite(value) else None
+
+
+def _calc_kernel(principal: float, months: int, monthly_rate: float) -> float:
+    """Monthly annuity payment for the given principal, term and monthly rate."""
+    if monthly_rate == 0:
+        return principal / months
+    # (1 + r) ** n computed once as exp(n * log1p(r)); expm1 keeps the
+    # denominator accurate for very small rates.
+    exponent = months * log1p(monthly_rate)
+    return principal * monthly_rate * exp(exponent) / expm1(exponent)
+
+
+if numba is not None:
+    # Compile the kernel to machine code; the pure-Python version stays
+    # reachable as `_calc_kernel.py_func` for debugging.
+    _calc_kernel = numba.njit(
+        "float64(float64, int64, float64)", cache=True, fastmath=True
+    )(_calc_kernel)
+    # Warm up so the first user calculation doesn't pay the load latency
+    _calc_kernel(1.0, 12, 0.01)
+
+
+@lru_cache(maxsize=1024)
+def _annuity_factor(months: int, annual_rate_percent: float) -> float:
+    """Monthly payment per 1 RUB of principal; terms and rates repeat a lot."""
+    return _calc_kernel(1.0, months, annual_rate_percent / 12 / 100)
 
 
 def calculate_monthly_payment(
@@ -91,13 +210,7 @@ def calculate_monthly_payment(
     principal = loan_amount - down_payment
     months = years * 12
     
-    if annual_rate_percent == 0:
-        monthly_payment = principal / months
-    else:
-        monthly_rate = annual_rate_percent / 12 / 100
-        monthly_payment = principal * (
-            monthly_rate * (1 + monthly_rate) ** months
-        ) / ((1 + monthly_rate) ** months - 1)
+    monthly_payment = principal * _annuity_factor(months, annual_rate_percent)
     
     total_payment = monthly_payment * months
     total_interest = total_payment - principal
@@ -111,23 +224,76 @@ def calculate_monthly_payment(
     }
 
 
-def get_session(chat_id: int) -> Dict[str, Any]:
-    """Get or create a session for the given chat_id."""
-    if chat_id not in sessions:
-        sessions[chat_id] = {
-            "loan_amount": None,
-            "down_payment": None,
-            "loan_term": None,
-            "interest_rate": None,
-        }
-    return sessions[chat_id]
+if numba is not None:
+    @numba.guvectorize(
+        ["void(float64[:], float64[:], int64[:], float64[:], float64[:])"],
+        "(n),(n),(n),(n)->(n)",
+        cache=True,
+    )
+    def calc_monthly_payment_vec(loan_amount, down_payment, years, annual_rate_percent, out):
+        """Monthly payments for arrays of loan scenarios (bulk re-pricing)."""
+        for i in range(loan_amount.shape[0]):
+            out[i] = _calc_kernel(
+                loan_amount[i] - down_payment[i],
+                years[i] * 12,
+                annual_rate_percent[i] / 12 / 100,
+            )
+else:
+    def calc_monthly_payment_vec(loan_amount, down_payment, years, annual_rate_percent):
+        """Monthly payments for arrays of loan scenarios (bulk re-pricing)."""
+        # numpy is only needed for bulk pricing, not by the bot itself
+        import numpy as np
+        
+        return np.asarray(
+            [
+                _calc_kernel(float(loan - down), int(term) * 12, rate / 12 / 100)
+                for loan, down, term, rate in zip(
+                    loan_amount, down_payment, years, annual_rate_percent
+                )
+            ],
+            dtype=np.float64,
+        )
+
 
+def get_session(context: ContextTypes.DEFAULT_TYPE) -> Optional[Session]:
+    """
+    Get the session stored in the chat's context.chat_data.
+    Returns None if there is none, e.g. because it has expired.
+    """
+    session = context.chat_data.get(SESSION_KEY)
+    if session is not None:
+        session.last_touch = time.monotonic()
+    return session
 
-def clear_session(chat_id: int) -> None:
-    """Clear session data for the given chat_id."""
-    if chat_id in sessions:
-        del sessions[chat_id]
-        logger.info(f"Session cleared for chat_id: {chat_id}")
+
+def clear_session(context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> None:
+    """Drop the chat's data, including its session."""
+    # .get() on the application's mapping doesn't create an entry the way
+    # context.chat_data does
+    chat_data = context.application.chat_data.get(chat_id)
+    if chat_data is not None:
+        context.application.drop_chat_data(chat_id)
+        if SESSION_KEY in chat_data:
+            logger.info("Session cleared for chat_id: %s", chat_id)
+
+
+async def evict_stale_sessions(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Drop chats whose session has been idle longer than SESSION_TIMEOUT_SECONDS.
+    Scans every chat's data on each run (O(number of chats)); chat_data keeps
+    no recency order to stop early on.
+    """
+    cutoff = time.monotonic() - SESSION_TIMEOUT_SECONDS
+    expired = [
+        chat_id
+        for chat_id, chat_data in context.application.chat_data.items()
+        if chat_data.get(SESSION_KEY) is not None
+        and chat_data[SESSION_KEY].last_touch < cutoff
+    ]
+    # Drop the whole entry so the per-chat mapping doesn't keep empty dicts
+    for chat_id in expired:
+        context.application.drop_chat_data(chat_id)
+        logger.info("Session expired for chat_id: %s", chat_id)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -135,45 +301,17 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     Handle /start command.
     Clears any existing session and begins new calculation.
     """
-    chat_id = update.effective_chat.id
-    
-    # Clear any existing session
-    clear_session(chat_id)
-    
-    # Create new session
-    get_session(chat_id)
-    
-    welcome_message = (
-        "🏠 *Mortgage Calculator 2026 (Russia)*\n\n"
-        "I will help you calculate your monthly mortgage payment.\n"
-        "All data is stored only during this session and will be deleted afterwards.\n\n"
-        "*Step 1:* Enter the loan amount you want (in RUB):"
-    )
+    # Replace any existing session with a fresh one
+    context.chat_data[SESSION_KEY] = Session()
+    logger.debug("Session reset for chat_id: %s", update.effective_chat.id)
     
-    await update.message.reply_text(welcome_message, parse_mode="Markdown")
+    await update.message.reply_text(_WELCOME_TEXT, parse_mode=ParseMode.HTML)
     return LOAN_AMOUNT
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /help command."""
-    help_text = (
-        "🏠 *Mortgage Calculator Bot*\n\n"
-        "This bot helps you calculate monthly mortgage payments.\n\n"
-        "*Commands:*\n"
-        "/start - Begin new calculation\n"
-        "/cancel - Cancel current calculation\n"
-        "/help - Show this help message\n\n"
-        "*How to use:*\n"
-        "1. Send /start to begin\n"
-        "2. Enter the loan amount\n"
-        "3. Enter your down payment\n"
-        "4. Enter loan term in years\n"
-        "5. Enter interest rate\n"
-        "6. Get your calculation results!\n\n"
-        "⚠️ All data is deleted after calculation is complete."
-    )
-    
-    await update.message.reply_text(help_text, parse_mode="Markdown")
+    await update.message.reply_text(_HELP_TEXT, parse_mode=ParseMode.HTML)
 
 
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -181,22 +319,21 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     Handle /cancel command.
     Cancels current calculation and clears session data.
     """
-    chat_id = update.effective_chat.id
-    clear_session(chat_id)
+    clear_session(context, update.effective_chat.id)
     
-    await update.message.reply_text(
-        "❌ Calculation cancelled. All data has been deleted.\n\n"
-        "Type /start to begin a new calculation."
-    )
+    await update.message.reply_text(_CANCEL_TEXT)
     
     return ConversationHandler.END
 
 
 async def handle_loan_amount(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle loan amount input."""
-    chat_id = update.effective_chat.id
-    text = update.message.text
+    session = get_session(context)
+    if session is None:
+        await update.message.reply_text(_EXPIRED_TEXT)
+        return ConversationHandler.END
     
+    text = update.message.text
     amount = parse_number(text)
     
     if amount is None or amount <= 0:
@@ -206,13 +343,19 @@ async def handle_loan_amount(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
         return LOAN_AMOUNT
     
-    session = get_session(chat_id)
-    session["loan_amount"] = amount
+    if amount > MAX_LOAN_AMOUNT:
+        await update.message.reply_text(
+            f"⚠️ Loan amount cannot exceed {format_currency(MAX_LOAN_AMOUNT)}.\n"
+            "Please enter a smaller amount:"
+        )
+        return LOAN_AMOUNT
+    
+    session.loan_amount = amount
     
     await update.message.reply_text(
         f"✅ Loan amount: {format_currency(amount)}\n\n"
-        f"*Step 2:* Enter your down payment/savings (in RUB):",
-        parse_mode="Markdown",
+        f"<b>Step 2:</b> Enter your down payment/savings (in RUB):",
+        parse_mode=ParseMode.HTML,
     )
     
     return DOWN_PAYMENT
@@ -220,12 +363,14 @@ async def handle_loan_amount(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def handle_down_payment(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle down payment input."""
-    chat_id = update.effective_chat.id
-    text = update.message.text
+    session = get_session(context)
+    if session is None:
+        await update.message.reply_text(_EXPIRED_TEXT)
+        return ConversationHandler.END
     
+    text = update.message.text
     amount = parse_number(text)
-    session = get_session(chat_id)
-    loan_amount = session.get("loan_amount", 0)
+    loan_amount = session.loan_amount
     
     if amount is None or amount < 0:
         await update.message.reply_text(
@@ -242,12 +387,12 @@ async def handle_down_payment(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return DOWN_PAYMENT
     
-    session["down_payment"] = amount
+    session.down_payment = amount
     
     await update.message.reply_text(
         f"✅ Down payment: {format_currency(amount)}\n\n"
-        f"*Step 3:* Enter loan term in years ({MIN_LOAN_TERM_YEARS}-{MAX_LOAN_TERM_YEARS}):",
-        parse_mode="Markdown",
+        f"<b>Step 3:</b> Enter loan term in years ({MIN_LOAN_TERM_YEARS}-{MAX_LOAN_TERM_YEARS}):",
+        parse_mode=ParseMode.HTML,
     )
     
     return LOAN_TERM
@@ -255,9 +400,12 @@ async def handle_down_payment(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 async def handle_loan_term(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle loan term input."""
-    chat_id = update.effective_chat.id
-    text = update.message.text
+    session = get_session(context)
+    if session is None:
+        await update.message.reply_text(_EXPIRED_TEXT)
+        return ConversationHandler.END
     
+    text = update.message.text
     years = parse_number(text)
     
     if years is None or not (MIN_LOAN_TERM_YEARS <= years <= MAX_LOAN_TERM_YEARS):
@@ -267,14 +415,13 @@ async def handle_loan_term(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         )
         return LOAN_TERM
     
-    session = get_session(chat_id)
-    session["loan_term"] = int(years)
+    session.loan_term = int(years)
     
     await update.message.reply_text(
         f"✅ Loan term: {int(years)} years\n\n"
-        f"*Step 4:* Enter annual interest rate % "
+        f"<b>Step 4:</b> Enter annual interest rate % "
         f"(e.g., 12.5):",
-        parse_mode="Markdown",
+        parse_mode=ParseMode.HTML,
     )
     
     return INTEREST_RATE
@@ -282,9 +429,12 @@ async def handle_loan_term(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
 async def handle_interest_rate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle interest rate input and show calculation results."""
-    chat_id = update.effective_chat.id
-    text = update.message.text
+    session = get_session(context)
+    if session is None:
+        await update.message.reply_text(_EXPIRED_TEXT)
+        return ConversationHandler.END
     
+    text = update.message.text
     rate = parse_number(text)
     
     if rate is None or not (MIN_INTEREST_RATE <= rate <= MAX_INTEREST_RATE):
@@ -294,89 +444,132 @@ async def handle_interest_rate(update: Update, context: ContextTypes.DEFAULT_TYP
         )
         return INTEREST_RATE
     
-    session = get_session(chat_id)
-    session["interest_rate"] = rate
+    session.interest_rate = rate
     
     # Perform calculation
     result = calculate_monthly_payment(
-        loan_amount=session["loan_amount"],
-        down_payment=session["down_payment"],
-        years=session["loan_term"],
+        loan_amount=session.loan_amount,
+        down_payment=session.down_payment,
+        years=session.loan_term,
         annual_rate_percent=rate,
     )
     
     # Format results
-    results_message = (
-        "📊 *CALCULATION RESULTS:*\n\n"
-        f"• Loan Amount: {format_currency(session['loan_amount'])}\n"
-        f"• Down Payment: {format_currency(session['down_payment'])}\n"
-        f"• Loan Principal: {format_currency(result['principal'])}\n"
-        f"• Loan Term: {session['loan_term']} years ({result['months']} months)\n"
-        f"• Interest Rate: {rate:.1f}% per year\n\n"
-        f"💸 *Monthly Payment:* ~{format_currency(result['monthly_payment'])}\n"
-        f"💰 *Total Payment:* ~{format_currency(result['total_payment'])}\n"
-        f"💎 *Total Interest:* ~{format_currency(result['total_interest'])}\n\n"
-        "⚠️ _Note: This is an estimate. Actual terms may vary._\n"
-        "_All your data has been deleted from memory._\n\n"
-        "Type /start for new calculation."
+    results_message = _RESULTS_TEMPLATE.format(
+        loan_amount=format_currency(session.loan_amount),
+        down_payment=format_currency(session.down_payment),
+        principal=format_currency(result["principal"]),
+        loan_term=session.loan_term,
+        months=result["months"],
+        interest_rate=rate,
+        monthly_payment=format_currency(result["monthly_payment"]),
+        total_payment=format_currency(result["total_payment"]),
+        total_interest=format_currency(result["total_interest"]),
     )
     
     # Clear session after showing results
-    clear_session(chat_id)
+    clear_session(context, update.effective_chat.id)
     
-    await update.message.reply_text(results_message, parse_mode="Markdown")
+    await update.message.reply_text(results_message, parse_mode=ParseMode.HTML)
     
     return ConversationHandler.END
 
 
 async def handle_unknown(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle unknown messages outside of conversation."""
-    await update.message.reply_text(
-        "👋 Hello! I'm a Mortgage Calculator Bot.\n\n"
-        "Type /start to begin calculating your mortgage payment,\n"
-        "or /help for more information."
-    )
+    await update.message.reply_text(_UNKNOWN_TEXT)
+
+
+class OrjsonRequest(HTTPXRequest):
+    """HTTPXRequest that parses Telegram's JSON responses with orjson."""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # Let the default parser deal with malformed responses
+            return HTTPXRequest.parse_json_payload(payload)
+
+
+# Plain text that isn't a command; shared by all conversation steps
+_TEXT_NOCMD = filters.TEXT & ~filters.COMMAND
+
+# Fallback replies only go to new messages in private chats; edits and
+# group chatter are ignored
+_UNKNOWN_FILTER = (
+    _TEXT_NOCMD
+    & filters.ChatType.PRIVATE
+    & ~filters.UpdateType.EDITED_MESSAGE
+)
 
 
 def main() -> None:
     """Start the bot."""
-    if not TELEGRAM_BOT_TOKEN:
+    settings = get_settings()
+    
+    # Configure logging
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=settings.log_level,
+    )
+    
+    if not settings.telegram_bot_token:
         logger.error(
             "TELEGRAM_BOT_TOKEN not found! "
             "Please set it in .env file or environment variables."
         )
         return
     
+    # Use the libuv-based event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Create application
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    builder = Application.builder().token(settings.telegram_bot_token)
+    if orjson is not None:
+        builder = builder.request(
+            OrjsonRequest(connection_pool_size=256)
+        ).get_updates_request(OrjsonRequest())
+    application = builder.build()
     
     # Create conversation handler
     conv_handler = ConversationHandler(
         entry_points=[CommandHandler("start", start)],
         states={
             LOAN_AMOUNT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_loan_amount)
+                MessageHandler(_TEXT_NOCMD, handle_loan_amount)
             ],
             DOWN_PAYMENT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_down_payment)
+                MessageHandler(_TEXT_NOCMD, handle_down_payment)
             ],
             LOAN_TERM: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_loan_term)
+                MessageHandler(_TEXT_NOCMD, handle_loan_term)
             ],
             INTEREST_RATE: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_interest_rate)
+                MessageHandler(_TEXT_NOCMD, handle_interest_rate)
             ],
         },
         fallbacks=[
             CommandHandler("cancel", cancel),
             CommandHandler("start", start),
         ],
+        # End abandoned conversations together with their session data
+        conversation_timeout=SESSION_TIMEOUT_SECONDS,
     )
     
     # Add handlers
     application.add_handler(conv_handler)
     application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_unknown))
+    application.add_handler(MessageHandler(_UNKNOWN_FILTER, handle_unknown))
+    
+    # Periodically drop abandoned sessions
+    application.job_queue.run_repeating(
+        evict_stale_sessions, interval=SESSION_EVICTION_INTERVAL_SECONDS
+    )
     
     # Start polling
     logger.info("Bot is starting...")
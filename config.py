@@ -1,18 +1,52 @@
 """
 Configuration module for Mortgage Calculator Bot.
-Loads environment variables and provides configuration constants.
+Provides configuration constants and lazily loads environment settings.
 """
 
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_LEVEL = "WARNING"
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Settings read from the environment."""
+
+    # Telegram Bot Token
+    telegram_bot_token: Optional[str]
+    # Logging level name (DEBUG, INFO, WARNING, ...)
+    log_level: str
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load the .env file on first use and return the environment settings."""
+    load_dotenv()
+    
+    log_level = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
+    # getLevelName() maps known level names to their numeric value
+    if not isinstance(logging.getLevelName(log_level), int):
+        logger.warning(
+            "Unknown LOG_LEVEL %r, falling back to %s", log_level, DEFAULT_LOG_LEVEL
+        )
+        log_level = DEFAULT_LOG_LEVEL
+    
+    return Settings(
+        telegram_bot_token=os.getenv("TELEGRAM_BOT_TOKEN"),
+        log_level=log_level,
+    )
 
-# Telegram Bot Token
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
 # Validation limits
+MAX_LOAN_AMOUNT = 10_000_000_000
 MIN_LOAN_TERM_YEARS = 1
 MAX_LOAN_TERM_YEARS = 30
 MIN_INTEREST_RATE = 0.1
@@ -20,3 +54,6 @@ MAX_INTEREST_RATE = 30.0
 
 # Session timeout in seconds (24 hours)
 SESSION_TIMEOUT_SECONDS = 24 * 60 * 60
+
+# How often idle sessions are checked for expiry (5 minutes)
+SESSION_EVICTION_INTERVAL_SECONDS = 5 * 60
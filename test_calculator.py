@@ -3,11 +3,43 @@ Unit tests for the Mortgage Calculator Bot.
 Tests the core calculation and validation functions.
 """
 
+import os
 import unittest
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from telegram.ext import ConversationHandler
+
+import bot
 from bot import (
+    SESSION_KEY,
+    DOWN_PAYMENT,
+    INTEREST_RATE,
+    LOAN_AMOUNT,
+    cancel,
     calculate_monthly_payment,
+    calc_monthly_payment_vec,
     parse_number,
     format_currency,
+    evict_stale_sessions,
+    handle_down_payment,
+    handle_interest_rate,
+    handle_loan_amount,
+    handle_loan_term,
+    start,
+)
+from config import (
+    MAX_INTEREST_RATE,
+    MAX_LOAN_AMOUNT,
+    MAX_LOAN_TERM_YEARS,
+    SESSION_TIMEOUT_SECONDS,
+    get_settings,
 )
 
 
@@ -86,6 +118,58 @@ class TestMortgageCalculator(unittest.TestCase):
         self.assertEqual(result["months"], 12)
 
 
+@unittest.skipUnless(np is not None, "numpy is required")
+class TestVectorized(unittest.TestCase):
+    """Test cases for the vectorized calculation that run with or without numba."""
+
+    def test_plain_lists(self):
+        """Test plain list input matches the scalar calculation."""
+        result = calc_monthly_payment_vec(
+            [5_000_000.0, 1_200_000.0], [1_000_000.0, 0.0], [15, 10], [12.0, 0.0]
+        )
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(len(result), 2)
+        self.assertAlmostEqual(
+            result[0],
+            calculate_monthly_payment(5_000_000, 1_000_000, 15, 12.0)["monthly_payment"],
+            places=6,
+        )
+        self.assertEqual(result[1], 1_200_000 / 120)
+
+
+@unittest.skipUnless(
+    bot.numba is not None and np is not None, "numba and numpy are required"
+)
+class TestBatch(unittest.TestCase):
+    """Test cases for the vectorized payment calculation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Warm up the compiled kernel once for the whole class."""
+        calc_monthly_payment_vec(
+            np.array([1.0]), np.array([0.0]), np.array([1]), np.array([1.0])
+        )
+
+    def test_matches_scalar(self):
+        """Test batch results match the scalar calculation."""
+        loan = np.array([5e6, 1.2e6, 3e6, 1e6])
+        down = np.array([1e6, 0.0, 0.0, 5e5])
+        years = np.array([15, 10, 20, 1], dtype=np.int64)
+        rate = np.array([12.0, 0.0, 10.0, 15.0])
+
+        result = calc_monthly_payment_vec(loan, down, years, rate)
+
+        expected = [
+            calculate_monthly_payment(*args)["monthly_payment"]
+            for args in zip(loan, down, years.tolist(), rate)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+        self.assertAlmostEqual(result[0], 48007, delta=1)
+        self.assertEqual(result[1], 1_200_000 / 120)
+
+
 class TestParseNumber(unittest.TestCase):
     """Test cases for number parsing function."""
 
@@ -110,6 +194,11 @@ class TestParseNumber(unittest.TestCase):
         self.assertIsNone(parse_number("abc"))
         self.assertIsNone(parse_number(""))
         self.assertIsNone(parse_number("12.5.5"))
+        self.assertIsNone(parse_number("inf"))
+        self.assertIsNone(parse_number("-inf"))
+        self.assertIsNone(parse_number("nan"))
+        self.assertIsNone(parse_number("1e400"))
+        self.assertIsNone(parse_number("9" * 400))
 
     def test_parse_whitespace(self):
         """Test parsing number with leading/trailing whitespace."""
@@ -136,5 +225,181 @@ class TestFormatCurrency(unittest.TestCase):
         self.assertEqual(format_currency(0), "0 RUB")
 
 
+class TestSettings(unittest.TestCase):
+    """Test cases for environment settings."""
+
+    def tearDown(self):
+        get_settings.cache_clear()
+
+    def load(self, log_level=None):
+        get_settings.cache_clear()
+        # Keep a developer's .env out of the test environment
+        with mock.patch("config.load_dotenv"), mock.patch.dict("os.environ"):
+            os.environ.pop("LOG_LEVEL", None)
+            if log_level is not None:
+                os.environ["LOG_LEVEL"] = log_level
+            return get_settings()
+
+    def test_log_level_default(self):
+        """Test log level defaults to WARNING."""
+        self.assertEqual(self.load().log_level, "WARNING")
+
+    def test_log_level_valid(self):
+        """Test a known log level name is accepted case-insensitively."""
+        self.assertEqual(self.load("debug").log_level, "DEBUG")
+
+    def test_log_level_invalid(self):
+        """Test an unknown log level falls back to WARNING with a warning."""
+        with self.assertLogs("config", level="WARNING"):
+            settings = self.load("verbose")
+        self.assertEqual(settings.log_level, "WARNING")
+
+
+class FakeApplication:
+    """Minimal stand-in for the Application's per-chat data store."""
+
+    def __init__(self):
+        self.chat_data = defaultdict(dict)
+
+    def drop_chat_data(self, chat_id):
+        self.chat_data.pop(chat_id, None)
+
+
+class FakeContext:
+    """Minimal stand-in for CallbackContext bound to one chat."""
+
+    def __init__(self, application, chat_id=None):
+        self.application = application
+        self._chat_id = chat_id
+
+    @property
+    def chat_data(self):
+        return self.application.chat_data[self._chat_id]
+
+
+class FakeMessage:
+    """Incoming text message that records the bot's replies."""
+
+    def __init__(self, text, replies):
+        self.text = text
+        self._replies = replies
+
+    async def reply_text(self, text, **kwargs):
+        self._replies.append(text)
+
+
+class ChatTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class running handlers against a fake single-chat application."""
+
+    CHAT_ID = 42
+
+    def setUp(self):
+        self.application = FakeApplication()
+        self.context = FakeContext(self.application, self.CHAT_ID)
+        self.replies = []
+
+    def update(self, text):
+        return SimpleNamespace(
+            effective_chat=SimpleNamespace(id=self.CHAT_ID),
+            message=FakeMessage(text, self.replies),
+        )
+
+
+class TestSessionExpiry(ChatTestCase):
+    """Test cases for sessions expiring in the middle of a conversation."""
+
+    async def expire_session(self):
+        self.context.chat_data[SESSION_KEY].last_touch -= SESSION_TIMEOUT_SECONDS + 1
+        await evict_stale_sessions(FakeContext(self.application))
+
+    async def test_expired_before_down_payment(self):
+        """Test an expired session ends the conversation at the down payment step."""
+        await start(self.update("/start"), self.context)
+        state = await handle_loan_amount(self.update("5000000"), self.context)
+        self.assertEqual(state, DOWN_PAYMENT)
+
+        await self.expire_session()
+
+        state = await handle_down_payment(self.update("1000000"), self.context)
+        self.assertEqual(state, ConversationHandler.END)
+        self.assertIn("/start", self.replies[-1])
+
+    async def test_expired_chat_data_is_dropped(self):
+        """Test eviction removes the expired chat's entry entirely."""
+        await start(self.update("/start"), self.context)
+        await self.expire_session()
+        self.assertNotIn(self.CHAT_ID, self.application.chat_data)
+
+    async def test_expired_before_interest_rate(self):
+        """Test an expired session ends the conversation instead of crashing."""
+        await start(self.update("/start"), self.context)
+        await handle_loan_amount(self.update("5000000"), self.context)
+        await handle_down_payment(self.update("1000000"), self.context)
+        state = await handle_loan_term(self.update("15"), self.context)
+        self.assertEqual(state, INTEREST_RATE)
+
+        await self.expire_session()
+
+        state = await handle_interest_rate(self.update("12"), self.context)
+        self.assertEqual(state, ConversationHandler.END)
+        self.assertIn("/start", self.replies[-1])
+
+    async def test_fresh_session_survives_eviction(self):
+        """Test eviction keeps sessions that are still active."""
+        await start(self.update("/start"), self.context)
+        await evict_stale_sessions(FakeContext(self.application))
+        state = await handle_loan_amount(self.update("5000000"), self.context)
+        self.assertEqual(state, DOWN_PAYMENT)
+
+
+class TestSessionCleanup(ChatTestCase):
+    """Test cases for removing chat data when a conversation ends."""
+
+    async def test_chat_data_dropped_after_results(self):
+        """Test the chat's entry is gone after the results are shown."""
+        await start(self.update("/start"), self.context)
+        await handle_loan_amount(self.update("5000000"), self.context)
+        await handle_down_payment(self.update("1000000"), self.context)
+        await handle_loan_term(self.update("15"), self.context)
+        await handle_interest_rate(self.update("12"), self.context)
+        self.assertNotIn(self.CHAT_ID, self.application.chat_data)
+
+    async def test_chat_data_dropped_after_cancel(self):
+        """Test the chat's entry is gone after /cancel."""
+        await start(self.update("/start"), self.context)
+        await handle_loan_amount(self.update("5000000"), self.context)
+        await cancel(self.update("/cancel"), self.context)
+        self.assertNotIn(self.CHAT_ID, self.application.chat_data)
+
+    async def test_cancel_without_session(self):
+        """Test /cancel outside a conversation doesn't create an entry."""
+        await cancel(self.update("/cancel"), self.context)
+        self.assertNotIn(self.CHAT_ID, self.application.chat_data)
+
+
+class TestLoanAmountLimit(ChatTestCase):
+    """Test cases for the loan amount upper bound."""
+
+    async def test_loan_amount_above_limit(self):
+        """Test a loan amount above MAX_LOAN_AMOUNT is rejected."""
+        await start(self.update("/start"), self.context)
+        state = await handle_loan_amount(self.update("1e308"), self.context)
+        self.assertEqual(state, LOAN_AMOUNT)
+        self.assertIsNone(self.context.chat_data[SESSION_KEY].loan_amount)
+
+    async def test_largest_loan_results_are_finite(self):
+        """Test the largest accepted inputs still produce formatted results."""
+        await start(self.update("/start"), self.context)
+        await handle_loan_amount(self.update(str(MAX_LOAN_AMOUNT)), self.context)
+        await handle_down_payment(self.update("0"), self.context)
+        await handle_loan_term(self.update(str(MAX_LOAN_TERM_YEARS)), self.context)
+        state = await handle_interest_rate(
+            self.update(str(MAX_INTEREST_RATE)), self.context
+        )
+        self.assertEqual(state, ConversationHandler.END)
+        self.assertIn("CALCULATION RESULTS", self.replies[-1])
+        self.assertNotIn("inf", self.replies[-1])
+
+
 if __name__ == "__main__":
     unittest.main()